@@ -0,0 +1,77 @@
+# benchmarks/ghost_table_benchmark.py
+"""Time ghost decisions with GhostMoveTable against the original neighbour scan.
+
+Uses the game maze (full tables) and a large random maze (lazy mode), with
+moving targets that change every call and fixed targets that repeat.
+
+    python benchmarks/ghost_table_benchmark.py --size 1000
+"""
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np
+from src.constants import DIRECTIONS, WALL
+from src.game_state import GameState
+from src.ghost_table import GhostMoveTable
+
+
+def scan(maze, cell, target):
+    """The neighbour scan Ghost._move_towards_target used before the table."""
+    best, best_distance = (0, 0), float('inf')
+    for dx, dy in DIRECTIONS.values():
+        x, y = cell[0] + dx, cell[1] + dy
+        if 0 <= x < len(maze) and 0 <= y < len(maze[0]) and maze[x][y] != WALL:
+            distance = (x - target[0]) ** 2 + (y - target[1]) ** 2
+            if distance < best_distance:
+                best_distance, best = distance, (dx, dy)
+    return best
+
+
+def time_us(fn, queries) -> float:
+    t0 = time.perf_counter()
+    for cell, target in queries:
+        fn(cell, target)
+    return (time.perf_counter() - t0) / len(queries) * 1e6
+
+
+def run(name: str, maze: np.ndarray, calls: int, rng: random.Random):
+    t0 = time.perf_counter()
+    table = GhostMoveTable(maze == WALL)
+    build_ms = (time.perf_counter() - t0) * 1000
+    rows, cols = maze.shape
+    cells = [(rng.randrange(rows), rng.randrange(cols)) for _ in range(calls)]
+    moving = [(cell, (rng.randrange(rows), rng.randrange(cols))) for cell in cells]
+    corners = [(1, 1), (1, cols - 2), (rows - 2, 1)]
+    fixed = [(cell, corners[i % len(corners)]) for i, cell in enumerate(cells)]
+
+    print(f"\n{name}: table built in {build_ms:.1f} ms")
+    print(f"  original scan          {time_us(lambda c, t: scan(maze, c, t), moving):8.2f} us/call")
+    print(f"  table, moving target   {time_us(table.approach, moving):8.2f} us/call")
+    t0 = time.perf_counter()
+    for target in corners:
+        table.approach(cells[0], target, fixed=True)
+    warm_ms = (time.perf_counter() - t0) * 1000 / len(corners)
+    print(f"  table, fixed target    {time_us(lambda c, t: table.approach(c, t, True), fixed):8.2f} us/call"
+          f"  (first use {warm_ms:.1f} ms per target)")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--size', type=int, default=1000)
+    parser.add_argument('--calls', type=int, default=100000)
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+    rng = random.Random(args.seed)
+
+    run('Game maze', GameState().maze, args.calls, rng)
+    big = (np.random.default_rng(args.seed).random((args.size, args.size)) < 0.2).astype(np.uint8)
+    run(f'Random maze {args.size}x{args.size}', big, args.calls, rng)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,81 @@
+# benchmarks/large_maze_benchmark.py
+"""Pathfinding on a memory-mapped stress-test maze.
+
+Generates a large uint8 maze file (or reuses --maze), opens it with np.memmap
+and runs CompactSearch between opposite corners, reporting time and peak RSS.
+Each algorithm runs in a fresh process so its peak RSS is its own.
+
+    python benchmarks/large_maze_benchmark.py --size 20000 --workdir /tmp
+"""
+import argparse
+import multiprocessing
+import os
+import resource
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.compact_search import CompactSearch
+from src.maze_file import generate_open_maze, open_maze
+from src.constants import EMPTY
+
+
+def peak_rss_mb() -> float:
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return rss / (1024 * 1024) if sys.platform == 'darwin' else rss / 1024
+
+
+def run_search(path: str, workdir: str, name: str, results) -> None:
+    """Run one search in a child process and report (path length, explored, seconds, peak RSS)."""
+    maze = open_maze(path)
+    search = CompactSearch(maze, workdir=workdir)
+    start, goal = (1, 1), (maze.shape[0] - 2, maze.shape[1] - 2)
+    t0 = time.perf_counter()
+    path_found, explored = getattr(search, name)(start, goal)
+    results.put((len(path_found), explored, time.perf_counter() - t0, peak_rss_mb()))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--size', type=int, default=5000)
+    parser.add_argument('--wall-density', type=float, default=0.2)
+    parser.add_argument('--maze', help='existing maze file to use instead of generating one')
+    parser.add_argument('--workdir', default=None,
+                        help='memory-map search arrays in this directory')
+    parser.add_argument('--algorithms', default='bfs,a_star')
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory(dir=args.workdir) as tmp:
+        path = args.maze
+        if path is None:
+            path = os.path.join(tmp, 'maze.npy')
+            t0 = time.perf_counter()
+            maze = generate_open_maze(path, args.size, args.size, args.wall_density)
+            # Clear the corners so a path exists in most layouts
+            maze[1:4, 1:4] = EMPTY
+            maze[-4:-1, -4:-1] = EMPTY
+            maze.flush()
+            del maze
+            print(f"generated {args.size}x{args.size} in {time.perf_counter() - t0:.1f}s, "
+                  f"{os.path.getsize(path) / 2**20:.0f} MB on disk")
+
+        t0 = time.perf_counter()
+        maze = open_maze(path)
+        print(f"opened in {(time.perf_counter() - t0) * 1000:.2f} ms")
+        del maze
+
+        ctx = multiprocessing.get_context('spawn')
+        results = ctx.Queue()
+        for name in args.algorithms.split(','):
+            worker = ctx.Process(target=run_search, args=(path, args.workdir and tmp, name, results))
+            worker.start()
+            length, explored, seconds, rss = results.get()
+            worker.join()
+            print(f"{name:<7} path {length:>8}  explored {explored:>11}  "
+                  f"{seconds:7.1f}s  peak RSS {rss:.0f} MB")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,112 @@
+# benchmarks/search_benchmark.py
+"""Compare explored node counts of the unidirectional and bidirectional searches.
+
+Runs every algorithm on the same random start/goal pairs over the game maze
+and over large, mostly open mazes, and checks that the shortest-path searches
+agree on path length. Pairs whose goal is a wall are checked separately: no
+search may return a path for them.
+
+    python benchmarks/search_benchmark.py --size 200 --pairs 50
+"""
+import argparse
+import os
+import random
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.game_state import GameState
+from src.search import SearchAlgorithms
+from src.constants import WALL, EMPTY
+
+# Algorithm name -> SearchAlgorithms method (all return shortest paths)
+ALGORITHMS = {
+    'BFS': 'bfs',
+    'Bi-BFS': 'bidirectional_bfs',
+    'A*': 'a_star',
+    'Bi-A*': 'bidirectional_a_star',
+}
+
+
+def open_maze(size: int, wall_density: float, rng: random.Random):
+    """Build a bordered square maze with randomly scattered wall cells."""
+    maze = [[EMPTY] * size for _ in range(size)]
+    for i in range(size):
+        for j in range(size):
+            border = i in (0, size - 1) or j in (0, size - 1)
+            if border or rng.random() < wall_density:
+                maze[i][j] = WALL
+    return maze
+
+
+def random_pairs(maze, count: int, rng: random.Random):
+    """Pick ``count`` random (start, goal) pairs of open cells."""
+    cells = [(i, j) for i in range(len(maze)) for j in range(len(maze[0]))
+             if maze[i][j] != WALL]
+    return [(rng.choice(cells), rng.choice(cells)) for _ in range(count)]
+
+
+def wall_goal_pairs(maze, count: int, rng: random.Random):
+    """Pick ``count`` pairs from an open cell to a wall cell, plus one wall-to-itself pair."""
+    cells = [(i, j) for i in range(len(maze)) for j in range(len(maze[0]))]
+    open_cells = [cell for cell in cells if maze[cell[0]][cell[1]] != WALL]
+    walls = [cell for cell in cells if maze[cell[0]][cell[1]] == WALL]
+    wall = rng.choice(walls)
+    return [(rng.choice(open_cells), rng.choice(walls)) for _ in range(count)] + [(wall, wall)]
+
+
+def check_wall_goals(name: str, maze, pairs):
+    """Every search must return an empty path when the goal is a wall."""
+    search = SearchAlgorithms(maze)
+    for algo, method in ALGORITHMS.items():
+        for start, goal in pairs:
+            path, _ = getattr(search, method)(start, goal)
+            if path:
+                sys.exit(f"{name}: {algo} returned a path from {start} into the wall at {goal}")
+
+
+def run(name: str, maze, pairs):
+    search = SearchAlgorithms(maze)
+    print(f"\n{name}")
+    print(f"{'algorithm':<10}{'mean nodes':>12}{'median nodes':>14}{'mean ms':>10}")
+    lengths = {}
+    for algo, method in ALGORITHMS.items():
+        nodes, times, algo_lengths = [], [], []
+        for start, goal in pairs:
+            t0 = time.perf_counter()
+            path, explored = getattr(search, method)(start, goal)
+            times.append(time.perf_counter() - t0)
+            nodes.append(len(explored))
+            algo_lengths.append(len(path))
+        lengths[algo] = algo_lengths
+        print(f"{algo:<10}{statistics.mean(nodes):>12.0f}{statistics.median(nodes):>14.0f}"
+              f"{statistics.mean(times) * 1000:>10.2f}")
+
+    reference = lengths['BFS']
+    for algo in ALGORITHMS:
+        if lengths[algo] != reference:
+            sys.exit(f"{algo} returned a path of different length than BFS")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--size', type=int, default=150)
+    parser.add_argument('--pairs', type=int, default=30)
+    parser.add_argument('--wall-density', type=float, default=0.2)
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+    rng = random.Random(args.seed)
+
+    game_maze = GameState().maze.tolist()
+    run('Game maze', game_maze, random_pairs(game_maze, args.pairs, rng))
+    check_wall_goals('Game maze', game_maze, wall_goal_pairs(game_maze, args.pairs, rng))
+
+    big_maze = open_maze(args.size, args.wall_density, rng)
+    run(f'Open maze {args.size}x{args.size}', big_maze, random_pairs(big_maze, args.pairs, rng))
+    check_wall_goals('Open maze', big_maze, wall_goal_pairs(big_maze, args.pairs, rng))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,66 @@
+# benchmarks/startup_benchmark.py
+"""Measure import time and peak RSS of the core and render layers.
+
+Each case runs in a fresh interpreter so nothing is shared between runs.
+
+    python benchmarks/startup_benchmark.py --runs 20
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Case name -> statement executed in the child interpreter
+CASES = {
+    'package only': 'import src',
+    'core': 'from src import GameState, Ghost, SearchAlgorithms, PacmanAgent',
+    'core + render': 'from src import GameState, PacmanAgent, GameVisualizer',
+}
+
+CHILD = """
+import json, resource, sys, time
+start = time.perf_counter()
+{stmt}
+elapsed = time.perf_counter() - start
+rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+if sys.platform == 'darwin':
+    rss //= 1024  # macOS reports bytes, Linux reports kilobytes
+print(json.dumps({{"import_ms": elapsed * 1000, "rss_kb": rss, "pygame": "pygame" in sys.modules}}))
+"""
+
+
+def run_case(stmt: str) -> dict:
+    """Run one import statement in a fresh interpreter and return its stats."""
+    out = subprocess.run(
+        [sys.executable, '-c', CHILD.format(stmt=stmt)],
+        cwd=ROOT, capture_output=True, text=True, check=True,
+    )
+    return json.loads(out.stdout.strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--runs', type=int, default=10)
+    args = parser.parse_args()
+
+    print(f"{'case':<16}{'median ms':>12}{'max RSS MB':>12}  pygame loaded")
+    for name, stmt in CASES.items():
+        try:
+            results = [run_case(stmt) for _ in range(args.runs)]
+        except subprocess.CalledProcessError as exc:
+            print(f"{name:<16}  failed: {exc.stderr.strip().splitlines()[-1]}")
+            continue
+        median_ms = statistics.median(r['import_ms'] for r in results)
+        rss_mb = max(r['rss_kb'] for r in results) / 1024
+        pygame_loaded = any(r['pygame'] for r in results)
+        print(f"{name:<16}{median_ms:>12.1f}{rss_mb:>12.1f}  {pygame_loaded}")
+        if name != 'core + render' and pygame_loaded:
+            sys.exit(f"{name}: pygame was imported by the core layer")
+
+
+if __name__ == '__main__':
+    main()
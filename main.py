@@ -1,8 +1,9 @@
+import argparse
 import pygame
 import time
 from src.game_state import GameState
 from src.visualization import GameVisualizer
-from src.pacman_agent import PacmanAgent
+from src.pacman_agent import PacmanAgent, load_params
 from src.constants import *
 
 def show_game_over_screen(visualizer, score, is_win=True):
@@ -38,7 +39,7 @@ def show_game_over_screen(visualizer, score, is_win=True):
         visualizer.screen.blit(restart_text, restart_rect)
         pygame.display.flip()
 
-def main():
+def main(params=None):
     running = True
     current_algorithm = 'A*'  # Default algorithm
     
@@ -47,7 +48,7 @@ def main():
         game_state = GameState()
         visualizer = GameVisualizer()
         visualizer.set_game_state(game_state)
-        pacman_agent = PacmanAgent(game_state)
+        pacman_agent = PacmanAgent(game_state, params)
         game_running = True
         last_move_time = time.time()
 
@@ -66,6 +67,14 @@ def main():
                         running = False
                     elif event.key == pygame.K_p:  # Pause
                         time.sleep(0.5)
+                    elif event.key == pygame.K_a and event.mod & pygame.KMOD_SHIFT:  # Switch to bidirectional A*
+                        current_algorithm = 'Bi-A*'
+                        pacman_agent.algorithm = 'Bi-A*'
+                        pacman_agent.current_path = []  # Reset path
+                    elif event.key == pygame.K_b and event.mod & pygame.KMOD_SHIFT:  # Switch to bidirectional BFS
+                        current_algorithm = 'Bi-BFS'
+                        pacman_agent.algorithm = 'Bi-BFS'
+                        pacman_agent.current_path = []  # Reset path
                     elif event.key == pygame.K_a:  # Switch to A*
                         current_algorithm = 'A*'
                         pacman_agent.algorithm = 'A*'
@@ -130,4 +139,7 @@ def main():
     pygame.quit()
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    parser = argparse.ArgumentParser(description='AI PACMAN')
+    parser.add_argument('--params', help='agent parameters written by python -m src.tuner')
+    args = parser.parse_args()
+    main(load_params(args.params) if args.params else None)
\ No newline at end of file
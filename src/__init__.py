@@ -0,0 +1,48 @@
+"""AI PACMAN package.
+
+The package is split into two layers:
+
+- core: ``GameState``, ``Ghost``, ``SearchAlgorithms`` and ``PacmanAgent``.
+  These never import pygame and can be used by headless batch jobs.
+- render: ``GameVisualizer``, which pulls in pygame.
+
+Names are resolved lazily on first access, so ``from src import GameState``
+only loads the simulation modules and ``import src`` loads nothing at all.
+"""
+from importlib import import_module
+
+# Public name -> module that defines it
+_CORE = {
+    'GameState': '.game_state',
+    'Ghost': '.ghost',
+    'GhostMoveTable': '.ghost_table',
+    'SearchAlgorithms': '.search',
+    'PacmanAgent': '.pacman_agent',
+    'load_params': '.pacman_agent',
+    'play_game': '.headless',
+    'ZobristKeys': '.zobrist',
+    'TranspositionTable': '.zobrist',
+    'CompactSearch': '.compact_search',
+    'open_maze': '.maze_file',
+    'save_maze': '.maze_file',
+}
+_RENDER = {
+    'GameVisualizer': '.visualization',
+}
+_LAZY = {**_CORE, **_RENDER}
+
+__all__ = list(_LAZY)
+
+
+def __getattr__(name):
+    """Import the module defining ``name`` the first time it is requested."""
+    module_name = _LAZY.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module_name, __name__), name)
+    globals()[name] = value  # Cache so later lookups skip __getattr__
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,158 @@
+# src/compact_search.py
+import heapq
+import tempfile
+from array import array
+from typing import List, Tuple
+import numpy as np
+from .constants import *
+
+# Parent codes: 0 = not reached, k + 1 = reached by moving _MOVES[k] from the parent
+_MOVES = list(DIRECTIONS.values())
+_UNSEEN = 0
+_START = len(_MOVES) + 1
+
+class CompactSearch:
+    """Pathfinding for very large mazes with compact working memory.
+
+    SearchAlgorithms keeps dicts and sets of tuples, roughly 100 bytes per
+    visited cell. Here the only per-cell structure is a uint8 parent array that
+    doubles as the visited bitmap (one byte per cell), optionally memory-mapped
+    from a temporary file under ``workdir``. The maze itself can be a
+    memory-mapped array from maze_file.open_maze.
+
+    On top of that, BFS only holds the current and next frontier as int64
+    index arrays. A*'s open list costs 8 bytes per pushed entry, up to 32
+    bytes per explored cell, and is not memory-mapped: its memory grows with
+    the area A* explores rather than staying under a fixed ceiling.
+
+    Both searches return ``(path, explored_count)``: the path excludes the
+    start like SearchAlgorithms, but explored nodes are only counted, since
+    listing them would cost more memory than the search itself.
+    """
+
+    def __init__(self, maze, workdir: str = None):
+        self.maze = np.asarray(maze)
+        self.rows, self.cols = self.maze.shape
+        self.workdir = workdir
+        self._walls = self.maze.reshape(-1)
+
+    def _parent_array(self) -> np.ndarray:
+        """Zeroed uint8 array with one entry per cell."""
+        size = self.rows * self.cols
+        if self.workdir is None:
+            return np.zeros(size, dtype=np.uint8)
+        # Anonymous temporary file: removed automatically once the mapping is gone
+        with tempfile.TemporaryFile(dir=self.workdir) as f:
+            return np.memmap(f, dtype=np.uint8, mode='w+', shape=(size,))
+
+    def _is_open(self, pos: Tuple[int, int]) -> bool:
+        x, y = pos
+        return 0 <= x < self.rows and 0 <= y < self.cols and self.maze[x, y] != WALL
+
+    def _trace_path(self, parents: np.ndarray, goal: int) -> List[Tuple[int, int]]:
+        """Follow parent codes back from ``goal``; the returned path excludes the start."""
+        path = []
+        x, y = divmod(goal, self.cols)
+        code = parents[goal]
+        while code != _START:
+            path.append((x, y))
+            dx, dy = _MOVES[code - 1]
+            x, y = x - dx, y - dy
+            code = parents[x * self.cols + y]
+        path.reverse()
+        return path
+
+    def bfs(self, start: Tuple[int, int], goal: Tuple[int, int]) -> Tuple[List[Tuple[int, int]], int]:
+        """Level-synchronous BFS over NumPy index arrays.
+
+        Each level is expanded with a handful of vectorised operations, so the
+        Python overhead is per level rather than per cell.
+        """
+        if not (self._is_open(start) and self._is_open(goal)):
+            return [], 0
+
+        cols = self.cols
+        parents = self._parent_array()
+        start_idx = start[0] * cols + start[1]
+        goal_idx = goal[0] * cols + goal[1]
+        parents[start_idx] = _START
+        frontier = np.array([start_idx], dtype=np.int64)
+        explored = 0
+
+        while frontier.size:
+            explored += frontier.size
+            if parents[goal_idx] != _UNSEEN:
+                return self._trace_path(parents, goal_idx), explored
+
+            x, y = np.divmod(frontier, cols)
+            next_levels = []
+            for code, (dx, dy) in enumerate(_MOVES, start=1):
+                nx, ny = x + dx, y + dy
+                inside = (nx >= 0) & (nx < self.rows) & (ny >= 0) & (ny < cols)
+                idx = nx[inside] * cols + ny[inside]
+                idx = idx[(self._walls[idx] != WALL) & (parents[idx] == _UNSEEN)]
+                parents[idx] = code
+                next_levels.append(idx)
+            frontier = np.unique(np.concatenate(next_levels))
+
+        return [], explored
+
+    def a_star(self, start: Tuple[int, int], goal: Tuple[int, int]) -> Tuple[List[Tuple[int, int]], int]:
+        """A* with Manhattan distance, recording parents only when a cell is closed.
+
+        The open list is a bucket queue: one ``array('q')`` per (f, cost) pair,
+        holding 8-byte ``cell << 3 | move`` entries, with a small heap over the
+        bucket keys. A cell is pushed at most once per neighbour, so the open
+        list never exceeds 32 bytes per explored cell on top of the parent
+        array. No per-cell cost table is needed: with a consistent heuristic
+        the first time a cell is popped is along a shortest path. Ties go to
+        the deeper entry, which keeps the search from flooding open areas.
+        """
+        if not (self._is_open(start) and self._is_open(goal)):
+            return [], 0
+
+        rows, cols = self.rows, self.cols
+        walls = self._walls
+        parents = self._parent_array()
+        gx, gy = goal
+        start_idx = start[0] * cols + start[1]
+        goal_idx = gx * cols + gy
+
+        # (f, -cost) -> entries; keys holds the same (f, -cost) pairs as a heap
+        start_key = (abs(start[0] - gx) + abs(start[1] - gy), 0)
+        buckets = {start_key: array('q', [(start_idx << 3) | _START])}
+        keys = [start_key]
+        explored = 0
+
+        while keys:
+            key = keys[0]
+            bucket = buckets[key]
+            entry = bucket.pop()
+            if not bucket:
+                del buckets[key]
+                heapq.heappop(keys)
+
+            current = entry >> 3
+            if parents[current] != _UNSEEN:
+                continue  # Already closed through a cheaper entry
+            parents[current] = entry & 7
+            explored += 1
+
+            if current == goal_idx:
+                return self._trace_path(parents, goal_idx), explored
+
+            cost = 1 - key[1]
+            x, y = divmod(current, cols)
+            for next_code, (dx, dy) in enumerate(_MOVES, start=1):
+                nx, ny = x + dx, y + dy
+                if 0 <= nx < rows and 0 <= ny < cols:
+                    next_idx = nx * cols + ny
+                    if walls[next_idx] != WALL and parents[next_idx] == _UNSEEN:
+                        next_key = (cost + abs(nx - gx) + abs(ny - gy), -cost)
+                        next_bucket = buckets.get(next_key)
+                        if next_bucket is None:
+                            next_bucket = buckets[next_key] = array('q')
+                            heapq.heappush(keys, next_key)
+                        next_bucket.append((next_idx << 3) | next_code)
+
+        return [], explored
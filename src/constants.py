@@ -26,6 +26,18 @@ POWER_PELLET_DURATION = 600  # 10 seconds at 60 FPS
 POWER_PELLET_WARNING = 180   # 3 seconds warning before ending
 GHOST_POINTS = [200, 400, 800, 1600]  # Points for eating ghosts in succession
 
+# PacmanAgent target scoring: score = distance_weight * dist + danger_weight * danger,
+# where each ghost closer than near_distance adds near_danger and each ghost
+# closer than far_distance adds far_danger
+AGENT_PARAMS = {
+    'distance_weight': 1.0,
+    'danger_weight': 1.0,
+    'near_distance': 2,
+    'near_danger': 1.0,
+    'far_distance': 3,
+    'far_danger': 0.5,
+}
+
 # Direction vectors (dx, dy)
 DIRECTIONS = {
     'RIGHT': (0, 1),
@@ -2,6 +2,8 @@
 # game_state.py
 import numpy as np
 from .ghost import Ghost
+from .ghost_table import GhostMoveTable
+from .zobrist import ZobristKeys
 from .constants import *
 
 class GameState:
@@ -27,7 +29,10 @@ class GameState:
             [1,1,2,1,2,1,2,1,1,1,1,1,2,1,2,1,2,1,1],
             [1,2,2,2,2,1,2,2,2,1,2,2,2,1,2,2,2,2,1],
             [1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1,1]
-        ])
+        ], dtype=np.uint8)
+        
+        # Ghost decisions precomputed for this wall layout
+        self.ghost_moves = GhostMoveTable.for_maze(self.maze)
         
         # Initialize ghosts with different personalities and starting positions
         self.ghosts = [
@@ -46,6 +51,10 @@ class GameState:
         self.scatter_mode = False
         self.scatter_timer = 0
         
+        # Zobrist hash of Pacman, ghost and pellet positions, updated incrementally
+        self.zobrist = ZobristKeys.for_board(len(self.maze), len(self.maze[0]), len(self.ghosts))
+        self.hash = self.zobrist.hash_state(self)
+        
         # Add visualization tracking
         self.current_algorithm = 'A*'
         self.explored_nodes = []
@@ -54,12 +63,12 @@ class GameState:
     def update(self):
         """Update game state including ghost positions and check collisions."""
         # Update ghost positions
-        for ghost in self.ghosts:
+        for index, ghost in enumerate(self.ghosts):
             dx, dy = ghost.get_next_move(self, tuple(self.pacman_pos))
             new_pos = [ghost.position[0] + dx, ghost.position[1] + dy]
             
             if self.is_valid_move(new_pos):
-                ghost.position = new_pos
+                self.move_ghost(index, new_pos)
                 
         # Check for collisions with ghosts
         self._check_ghost_collisions()
@@ -83,11 +92,11 @@ class GameState:
 
     def _reset_positions(self):
         """Reset Pacman and ghost positions after losing a life."""
-        self.pacman_pos = [14, 9]
+        self._set_pacman_pos([14, 9])
         self.last_pacman_pos = [14, 9]
         positions = [(8, 9), (9, 9), (10, 9)]
-        for ghost, pos in zip(self.ghosts, positions):
-            ghost.position = list(pos)
+        for index, pos in enumerate(positions[:len(self.ghosts)]):
+            self.move_ghost(index, list(pos))
 
     def get_pacman_direction(self) -> tuple:
         """Get Pacman's current direction based on last movement."""
@@ -105,9 +114,22 @@ class GameState:
     def update_pacman_pos(self, new_pos):
         """Update Pacman's position and track movement."""
         self.last_pacman_pos = self.pacman_pos.copy()
-        self.pacman_pos = new_pos
+        self._set_pacman_pos(new_pos)
         self.update_score(new_pos)
 
+    def _set_pacman_pos(self, new_pos):
+        """Move Pacman and update the hash."""
+        keys = self.zobrist.pacman
+        self.hash ^= keys[self.pacman_pos[0]][self.pacman_pos[1]] ^ keys[new_pos[0]][new_pos[1]]
+        self.pacman_pos = new_pos
+
+    def move_ghost(self, index, new_pos):
+        """Move the ghost at ``index`` and update the hash."""
+        ghost = self.ghosts[index]
+        keys = self.zobrist.ghosts[index]
+        self.hash ^= keys[ghost.position[0]][ghost.position[1]] ^ keys[new_pos[0]][new_pos[1]]
+        ghost.position = new_pos
+
     def update_score(self, pos):
         """Update score based on what Pacman ate."""
         x, y = pos
@@ -115,10 +137,12 @@ class GameState:
             self.score += 10
             self.maze[x][y] = EMPTY
             self.remaining_food -= 1
+            self.hash ^= self.zobrist.pellets[FOOD][x][y]
         elif self.maze[x][y] == POWER_PELLET:
             self.score += 50
             self.maze[x][y] = EMPTY
             self.remaining_food -= 1
+            self.hash ^= self.zobrist.pellets[POWER_PELLET][x][y]
 
     def _count_food(self):
         """Count the total number of food pellets and power pellets in the maze."""
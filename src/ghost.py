@@ -99,25 +99,12 @@ class Ghost:
         return self._move_towards_target(game_state, self.target)
         
     def _run_away(self, game_state, pacman_pos: Tuple[int, int]) -> Tuple[int, int]:
-        """Run away from Pacman when vulnerable."""
-        legal_moves = self.get_legal_moves(game_state)
-        if not legal_moves:
-            return (0, 0)
-            
-        # Choose the move that maximizes distance from Pacman
-        best_move = None
-        max_distance = -1
-        
-        for dx, dy in legal_moves:
-            new_x = self.position[0] + dx
-            new_y = self.position[1] + dy
-            distance = (new_x - pacman_pos[0])**2 + (new_y - pacman_pos[1])**2
-            
-            if distance > max_distance:
-                max_distance = distance
-                best_move = (dx, dy)
-                
-        return best_move if best_move else (0, 0)
+        """Run away from Pacman when vulnerable.
+
+        Picks the legal move that maximizes distance from Pacman, looked up in
+        the maze's precomputed GhostMoveTable.
+        """
+        return game_state.ghost_moves.flee(self.position, pacman_pos)
     
     def _scatter_behavior(self, game_state):
         """Makes ghost retreat to its assigned corner when in scatter mode."""
@@ -132,32 +119,20 @@ class Ghost:
             self.scatter_corner = corners.get(self.personality, (1, 1))
         
         # Move towards scatter corner
-        return self._move_towards_target(game_state, self.scatter_corner)
+        return self._move_towards_target(game_state, self.scatter_corner, fixed=True)
         
     def _return_home(self, game_state) -> Tuple[int, int]:
         """Return to home position when eaten."""
-        return self._move_towards_target(game_state, self.home_position)
+        return self._move_towards_target(game_state, self.home_position, fixed=True)
         
-    def _move_towards_target(self, game_state, target: Tuple[int, int]) -> Tuple[int, int]:
-        """Move towards a target position using available moves."""
-        legal_moves = self.get_legal_moves(game_state)
-        if not legal_moves:
-            return (0, 0)
-            
-        # Choose the move that minimizes distance to target
-        best_move = None
-        min_distance = float('inf')
-        
-        for dx, dy in legal_moves:
-            new_x = self.position[0] + dx
-            new_y = self.position[1] + dy
-            distance = (new_x - target[0])**2 + (new_y - target[1])**2
-            
-            if distance < min_distance:
-                min_distance = distance
-                best_move = (dx, dy)
-                
-        return best_move if best_move else (0, 0)
+    def _move_towards_target(self, game_state, target: Tuple[int, int], fixed: bool = False) -> Tuple[int, int]:
+        """Move towards a target position using available moves.
+
+        Picks the legal move that minimizes distance to the target, looked up
+        in the maze's precomputed GhostMoveTable. ``fixed`` marks targets that
+        do not move (scatter corner, home) so large mazes can cache them.
+        """
+        return game_state.ghost_moves.approach(self.position, target, fixed)
         
     def make_vulnerable(self):
         """Make ghost vulnerable after Pacman eats power pellet."""
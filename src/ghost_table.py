@@ -0,0 +1,149 @@
+# src/ghost_table.py
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Tuple
+import numpy as np
+from .constants import *
+
+# Move codes index DIRECTIONS in order; the last code means no legal move
+_MOVES = list(DIRECTIONS.values()) + [(0, 0)]
+_STAY = len(_MOVES) - 1
+_DX = np.array([d[0] for d in _MOVES[:_STAY]], dtype=np.int32)
+_DY = np.array([d[1] for d in _MOVES[:_STAY]], dtype=np.int32)
+
+class GhostMoveTable:
+    """Precomputed ghost decisions for a fixed wall layout.
+
+    Ghost._move_towards_target and Ghost._run_away only depend on the ghost's
+    cell, the target cell and the walls, so every answer is computed once and
+    stored as a uint8 move code in a (target, cell) table. Ties are broken the
+    way the ghost's own scan did, by DIRECTIONS order.
+
+    Small mazes get both full tables up front. Past ``full_table_cells`` cells
+    the tables would grow with the square of the board, so only a one-byte
+    legal-move mask per cell is kept. Targets the caller marks as fixed
+    (scatter corners, home positions) get a row of move codes built on first
+    use, at most ``max_targets`` of them (LRU). Moving targets such as Pacman
+    are answered by scanning the four neighbours against the mask, since a
+    row would be rebuilt almost every tick.
+
+    ``walls`` is truthy where a cell is a wall (bool or 0/1); use for_maze to
+    build from a maze of cell types.
+    """
+
+    def __init__(self, walls: np.ndarray, full_table_cells: int = 2048, max_targets: int = 64):
+        walls = np.asarray(walls, dtype=bool)
+        self.rows, self.cols = walls.shape
+        num_cells = self.rows * self.cols
+        self.max_targets = max_targets
+
+        # Bit k set when DIRECTIONS move k is legal from the cell
+        self._legal = np.zeros(num_cells, dtype=np.uint8)
+        open_cells = ~walls
+        for k, (dx, dy) in enumerate(_MOVES[:_STAY]):
+            legal = np.zeros_like(open_cells)
+            src_x = slice(max(0, -dx), self.rows - max(0, dx))
+            src_y = slice(max(0, -dy), self.cols - max(0, dy))
+            dst_x = slice(max(0, dx), self.rows - max(0, -dx))
+            dst_y = slice(max(0, dy), self.cols - max(0, -dy))
+            legal[src_x, src_y] = open_cells[dst_x, dst_y]
+            self._legal |= legal.reshape(-1).astype(np.uint8) << k
+
+        if num_cells <= full_table_cells:
+            self._approach = self._build(np.arange(num_cells), flee=False)
+            self._flee = self._build(np.arange(num_cells), flee=True)
+            self._rows = None
+        else:
+            self._approach = self._flee = None
+            self._rows = OrderedDict()  # (flee, target index) -> move codes per cell
+
+    @staticmethod
+    def for_maze(maze) -> 'GhostMoveTable':
+        """Shared table per wall layout, so repeated games on one maze build it once."""
+        walls = np.asarray(maze) == WALL
+        return _table_for_walls(walls.shape, np.packbits(walls).tobytes())
+
+    def _build(self, targets: np.ndarray, flee: bool, block_cells: int = 1 << 16) -> np.ndarray:
+        """Move codes for each target (rows) and ghost cell (columns).
+
+        Cells are processed in blocks so the (targets, cells, 4) distance
+        array stays around a million entries.
+        """
+        num_cells = self.rows * self.cols
+        codes = np.empty((len(targets), num_cells), dtype=np.uint8)
+        tx, ty = np.divmod(targets.astype(np.int32), self.cols)
+        block = max(1, min(block_cells, (1 << 20) // (4 * len(targets))))
+        for start in range(0, num_cells, block):
+            cells = np.arange(start, min(start + block, num_cells), dtype=np.int32)
+            x, y = np.divmod(cells, self.cols)
+            mask = self._legal[cells]
+            legal = ((mask[:, None] >> np.arange(_STAY, dtype=np.uint8)) & 1).astype(bool)
+            nx = x[:, None] + _DX
+            ny = y[:, None] + _DY
+            dist = (nx - tx[:, None, None]) ** 2 + (ny - ty[:, None, None]) ** 2
+            if flee:
+                best = np.where(legal, dist, -1).argmax(axis=2)
+            else:
+                best = np.where(legal, dist, np.iinfo(dist.dtype).max).argmin(axis=2)
+            best[:, mask == 0] = _STAY
+            codes[:, start:start + len(cells)] = best
+        return codes
+
+    def _row(self, target: int, flee: bool) -> np.ndarray:
+        """Move codes towards or away from one fixed target, built on demand."""
+        key = (flee, target)
+        row = self._rows.get(key)
+        if row is None:
+            row = self._build(np.array([target]), flee)[0]
+            self._rows[key] = row
+            if len(self._rows) > self.max_targets:
+                self._rows.popitem(last=False)
+        else:
+            self._rows.move_to_end(key)
+        return row
+
+    def _scan(self, cell, target, flee: bool) -> Tuple[int, int]:
+        """Pick a move by checking the four neighbours, without any table row."""
+        x, y = cell
+        tx, ty = target
+        mask = int(self._legal[x * self.cols + y])
+        best = _STAY
+        best_distance = -1 if flee else float('inf')
+        for k in range(_STAY):
+            if mask >> k & 1:
+                dx, dy = _MOVES[k]
+                distance = (x + dx - tx) ** 2 + (y + dy - ty) ** 2
+                if (distance > best_distance) if flee else (distance < best_distance):
+                    best_distance = distance
+                    best = k
+        return _MOVES[best]
+
+    def _lookup(self, cell, target, flee: bool, fixed: bool) -> Tuple[int, int]:
+        if not (0 <= target[0] < self.rows and 0 <= target[1] < self.cols):
+            return self._scan(cell, target, flee)  # Tables only cover on-board targets
+        cell_idx = cell[0] * self.cols + cell[1]
+        target_idx = target[0] * self.cols + target[1]
+        if self._rows is None:
+            table = self._flee if flee else self._approach
+            return _MOVES[table[target_idx, cell_idx]]
+        if fixed:
+            return _MOVES[self._row(target_idx, flee)[cell_idx]]
+        return self._scan(cell, target, flee)
+
+    def approach(self, cell, target, fixed: bool = False) -> Tuple[int, int]:
+        """Legal move from ``cell`` that gets closest to ``target``.
+
+        Pass ``fixed=True`` for targets that stay put over many ticks, so large
+        mazes cache a row for them.
+        """
+        return self._lookup(cell, target, flee=False, fixed=fixed)
+
+    def flee(self, cell, target, fixed: bool = False) -> Tuple[int, int]:
+        """Legal move from ``cell`` that gets farthest from ``target``."""
+        return self._lookup(cell, target, flee=True, fixed=fixed)
+
+
+@lru_cache(maxsize=8)
+def _table_for_walls(shape: Tuple[int, int], packed_walls: bytes) -> GhostMoveTable:
+    walls = np.unpackbits(np.frombuffer(packed_walls, dtype=np.uint8), count=shape[0] * shape[1])
+    return GhostMoveTable(walls.reshape(shape).astype(bool))
@@ -0,0 +1,48 @@
+# src/headless.py
+import random
+from typing import Dict
+from .game_state import GameState
+from .pacman_agent import PacmanAgent
+
+def play_game(params: Dict[str, float] = None, seed: int = None, max_steps: int = 2000,
+              algorithm: str = 'A*') -> Dict[str, float]:
+    """Play one game without rendering and return its outcome.
+
+    Follows the same tick as main.py: Pacman moves, then ghosts move and
+    collisions are checked. ``seed`` fixes the ghosts' random choices so
+    different agent parameters can be compared on identical games; the
+    caller's global ``random`` state is restored afterwards.
+    """
+    if seed is None:
+        return _run_game(params, max_steps, algorithm)
+
+    saved_state = random.getstate()
+    random.seed(seed)
+    try:
+        return _run_game(params, max_steps, algorithm)
+    finally:
+        random.setstate(saved_state)
+
+def _run_game(params: Dict[str, float], max_steps: int, algorithm: str) -> Dict[str, float]:
+    """Run the game loop until the game ends or ``max_steps`` ticks pass."""
+    game_state = GameState()
+    pacman_agent = PacmanAgent(game_state, params)
+    pacman_agent.algorithm = algorithm
+
+    steps = 0
+    while not game_state.game_over and game_state.remaining_food > 0 and steps < max_steps:
+        dx, dy = pacman_agent.get_next_move()
+        new_pos = [game_state.pacman_pos[0] + dx, game_state.pacman_pos[1] + dy]
+
+        if game_state.is_valid_move(new_pos):
+            game_state.update_pacman_pos(new_pos)
+
+        game_state.update()
+        steps += 1
+
+    return {
+        'score': int(game_state.score),
+        'won': bool(game_state.remaining_food == 0),
+        'lives': game_state.lives,
+        'steps': steps,
+    }
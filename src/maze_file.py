@@ -0,0 +1,57 @@
+# src/maze_file.py
+"""Compact on-disk mazes for boards too large to keep in memory.
+
+Mazes are stored as ``.npy`` files of uint8 cells (one byte per cell instead
+of eight for the default int64) and opened with ``np.memmap``, so opening is
+instant and only the pages actually touched are read.
+"""
+import numpy as np
+from .constants import *
+
+MAZE_DTYPE = np.uint8
+
+
+def save_maze(path: str, maze) -> None:
+    """Write a maze to ``path`` as a uint8 .npy file."""
+    out = create_maze(path, len(maze), len(maze[0]))
+    out[:] = np.asarray(maze, dtype=MAZE_DTYPE)
+    out.flush()
+
+
+def create_maze(path: str, rows: int, cols: int, fill: int = EMPTY) -> np.memmap:
+    """Create a writable memory-mapped maze file of the given size."""
+    maze = np.lib.format.open_memmap(path, mode='w+', dtype=MAZE_DTYPE, shape=(rows, cols))
+    if fill != 0:
+        maze[:] = fill
+    return maze
+
+
+def open_maze(path: str, mode: str = 'r') -> np.memmap:
+    """Memory-map a maze file.
+
+    Use mode 'r' for read-only search, 'c' (copy-on-write) to play on the
+    board without changing the file, or 'r+' to edit the file in place.
+    """
+    maze = np.load(path, mmap_mode=mode)
+    if maze.dtype != MAZE_DTYPE or maze.ndim != 2:
+        raise ValueError(f"{path} is not a 2D {np.dtype(MAZE_DTYPE).name} maze")
+    return maze
+
+
+def generate_open_maze(path: str, rows: int, cols: int, wall_density: float = 0.2,
+                       seed: int = 0, chunk_rows: int = 1024) -> np.memmap:
+    """Write a bordered maze with randomly scattered walls, one block of rows at a time.
+
+    Memory use stays at a few blocks no matter how large the board is.
+    """
+    rng = np.random.default_rng(seed)
+    maze = create_maze(path, rows, cols)
+    for top in range(0, rows, chunk_rows):
+        bottom = min(top + chunk_rows, rows)
+        block = rng.random((bottom - top, cols)) < wall_density
+        block[:, 0] = block[:, -1] = True
+        maze[top:bottom] = block * MAZE_DTYPE(WALL)
+    maze[0, :] = WALL
+    maze[-1, :] = WALL
+    maze.flush()
+    return maze
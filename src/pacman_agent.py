@@ -1,11 +1,20 @@
 # src/pacman_agent.py
-from typing import Tuple, List
+import json
+from typing import Tuple, List, Dict
 from .search import SearchAlgorithms
 from .constants import *
 
+def load_params(path: str) -> Dict[str, float]:
+    """Load agent parameters from a JSON file written by the tuner."""
+    with open(path) as f:
+        data = json.load(f)
+    # The tuner stores the parameters next to its scores
+    return data.get('params', data)
+
 class PacmanAgent:
-    def __init__(self, game_state):
+    def __init__(self, game_state, params: Dict[str, float] = None):
         self.game_state = game_state
+        self.params = {**AGENT_PARAMS, **(params or {})}
         self.search_algorithms = SearchAlgorithms(game_state.maze)
         self.current_path = []
         self.current_target = None
@@ -23,13 +32,14 @@ class PacmanAgent:
         
     def calculate_danger(self, pos: Tuple[int, int]) -> float:
         """Calculate danger level at a position based on ghost positions."""
+        params = self.params
         danger = 0
         for ghost in self.game_state.ghosts:
             distance = abs(pos[0] - ghost.position[0]) + abs(pos[1] - ghost.position[1])
-            if distance < 2:
-                danger += 1.0
-            elif distance < 3:
-                danger += 0.5
+            if distance < params['near_distance']:
+                danger += params['near_danger']
+            elif distance < params['far_distance']:
+                danger += params['far_danger']
         return danger
 
     def get_next_move(self) -> Tuple[int, int]:
@@ -52,7 +62,7 @@ class PacmanAgent:
                 danger = self.calculate_danger(food)
                 
                 # Balance between distance and danger
-                score = dist + danger
+                score = self.params['distance_weight'] * dist + self.params['danger_weight'] * danger
                 
                 if score < best_score:
                     # Use selected algorithm
@@ -60,6 +70,10 @@ class PacmanAgent:
                         path, explored = self.search_algorithms.bfs(current_pos, food)
                     elif self.algorithm == 'DFS':
                         path, explored = self.search_algorithms.dfs(current_pos, food)
+                    elif self.algorithm == 'Bi-BFS':
+                        path, explored = self.search_algorithms.bidirectional_bfs(current_pos, food)
+                    elif self.algorithm == 'Bi-A*':
+                        path, explored = self.search_algorithms.bidirectional_a_star(current_pos, food)
                     else:  # A*
                         path, explored = self.search_algorithms.a_star(current_pos, food)
                         
@@ -82,4 +96,4 @@ class PacmanAgent:
         return (0, 0)  # No valid move found
 
 # Make sure PacmanAgent is explicitly exported
-__all__ = ['PacmanAgent']
\ No newline at end of file
+__all__ = ['PacmanAgent', 'load_params']
\ No newline at end of file
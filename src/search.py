@@ -1,6 +1,6 @@
 # search.py
+import heapq
 from collections import deque
-from queue import PriorityQueue
 from typing import List, Tuple, Dict, Set
 from .constants import *
 
@@ -26,6 +26,11 @@ class SearchAlgorithms:
         """Calculate Manhattan distance between two positions."""
         return abs(pos1[0] - pos2[0]) + abs(pos1[1] - pos2[1])
 
+    def _is_open(self, pos: Tuple[int, int]) -> bool:
+        """Check that a position is inside the maze and not a wall."""
+        x, y = pos
+        return 0 <= x < len(self.maze) and 0 <= y < len(self.maze[0]) and self.maze[x][y] != WALL
+
     def bfs(self, start: Tuple[int, int], goal: Tuple[int, int]) -> Tuple[List[Tuple[int, int]], List[Tuple[int, int]]]:
         """BFS implementation that returns both path and explored nodes."""
         queue = deque([[start]])
@@ -74,14 +79,13 @@ class SearchAlgorithms:
 
     def a_star(self, start: Tuple[int, int], goal: Tuple[int, int]) -> Tuple[List[Tuple[int, int]], List[Tuple[int, int]]]:
         """A* implementation that returns both path and explored nodes."""
-        frontier = PriorityQueue()
-        frontier.put((0, start))
+        frontier = [(0, start)]
         came_from = {start: None}
         cost_so_far = {start: 0}
         explored_nodes = []
         
-        while not frontier.empty():
-            current = frontier.get()[1]
+        while frontier:
+            current = heapq.heappop(frontier)[1]
             explored_nodes.append(current)
             
             if current == goal:
@@ -99,7 +103,129 @@ class SearchAlgorithms:
                 if next_pos not in cost_so_far or new_cost < cost_so_far[next_pos]:
                     cost_so_far[next_pos] = new_cost
                     priority = new_cost + self.manhattan_distance(next_pos, goal)
-                    frontier.put((priority, next_pos))
+                    heapq.heappush(frontier, (priority, next_pos))
                     came_from[next_pos] = current
         
-        return [], explored_nodes
\ No newline at end of file
+        return [], explored_nodes
+
+    def _join_paths(self, meet: Tuple[int, int], parents_fwd: Dict, parents_bwd: Dict) -> List[Tuple[int, int]]:
+        """Join the two half paths that meet at ``meet``, excluding the start."""
+        path = []
+        current = meet
+        while current is not None:
+            path.append(current)
+            current = parents_fwd[current]
+        path.reverse()
+        current = parents_bwd[meet]
+        while current is not None:
+            path.append(current)
+            current = parents_bwd[current]
+        return path[1:]
+
+    def bidirectional_bfs(self, start: Tuple[int, int], goal: Tuple[int, int]) -> Tuple[List[Tuple[int, int]], List[Tuple[int, int]]]:
+        """Bidirectional BFS that returns both path and explored nodes.
+
+        Both sides grow one full level at a time, always expanding the smaller
+        frontier. The level in which the frontiers first touch is finished
+        before stopping so the shortest meeting point is kept.
+        """
+        if not (self._is_open(start) and self._is_open(goal)):
+            return [], []
+        if start == goal:
+            return [], [start]
+
+        parents_fwd = {start: None}
+        parents_bwd = {goal: None}
+        depth_fwd = {start: 0}
+        depth_bwd = {goal: 0}
+        frontier_fwd = [start]
+        frontier_bwd = [goal]
+        explored_nodes = []
+
+        while frontier_fwd and frontier_bwd:
+            # Expand the smaller side
+            forward = len(frontier_fwd) <= len(frontier_bwd)
+            if forward:
+                frontier, parents, depth, other_depth = frontier_fwd, parents_fwd, depth_fwd, depth_bwd
+            else:
+                frontier, parents, depth, other_depth = frontier_bwd, parents_bwd, depth_bwd, depth_fwd
+
+            next_frontier = []
+            meet = None
+            best_length = float('inf')
+            for current in frontier:
+                explored_nodes.append(current)
+                for next_pos in self.get_legal_moves(current):
+                    if next_pos in parents:
+                        continue
+                    parents[next_pos] = current
+                    depth[next_pos] = depth[current] + 1
+                    next_frontier.append(next_pos)
+                    if next_pos in other_depth and depth[next_pos] + other_depth[next_pos] < best_length:
+                        best_length = depth[next_pos] + other_depth[next_pos]
+                        meet = next_pos
+
+            if meet is not None:
+                return self._join_paths(meet, parents_fwd, parents_bwd), explored_nodes
+
+            if forward:
+                frontier_fwd = next_frontier
+            else:
+                frontier_bwd = next_frontier
+
+        return [], explored_nodes
+
+    def bidirectional_a_star(self, start: Tuple[int, int], goal: Tuple[int, int]) -> Tuple[List[Tuple[int, int]], List[Tuple[int, int]]]:
+        """Bidirectional A* that returns both path and explored nodes.
+
+        The forward search aims at the goal and the backward search at the
+        start, both with Manhattan distance. ``best_cost`` holds the shortest
+        start-goal path seen so far; once the smallest f on either open list
+        reaches it, no cheaper path can exist and the search stops.
+        """
+        if not (self._is_open(start) and self._is_open(goal)):
+            return [], []
+        if start == goal:
+            return [], [start]
+
+        sides = [
+            # (frontier, cost_so_far, came_from, target)
+            ([(self.manhattan_distance(start, goal), start)], {start: 0}, {start: None}, goal),
+            ([(self.manhattan_distance(goal, start), goal)], {goal: 0}, {goal: None}, start),
+        ]
+        closed = [set(), set()]
+        best_cost = float('inf')
+        meet = None
+        explored_nodes = []
+
+        while sides[0][0] and sides[1][0]:
+            if max(sides[0][0][0][0], sides[1][0][0][0]) >= best_cost:
+                break
+
+            # Expand the side with the smaller open list
+            side = 0 if len(sides[0][0]) <= len(sides[1][0]) else 1
+            frontier, cost_so_far, came_from, target = sides[side]
+            other_cost = sides[1 - side][1]
+
+            current = heapq.heappop(frontier)[1]
+            if current in closed[side]:
+                continue  # Stale entry superseded by a cheaper one
+            closed[side].add(current)
+            explored_nodes.append(current)
+
+            for next_pos in self.get_legal_moves(current):
+                new_cost = cost_so_far[current] + 1
+
+                if next_pos not in cost_so_far or new_cost < cost_so_far[next_pos]:
+                    cost_so_far[next_pos] = new_cost
+                    priority = new_cost + self.manhattan_distance(next_pos, target)
+                    heapq.heappush(frontier, (priority, next_pos))
+                    came_from[next_pos] = current
+
+                    if next_pos in other_cost and new_cost + other_cost[next_pos] < best_cost:
+                        best_cost = new_cost + other_cost[next_pos]
+                        meet = next_pos
+
+        if meet is None:
+            return [], explored_nodes
+        return self._join_paths(meet, sides[0][2], sides[1][2]), explored_nodes
@@ -0,0 +1,168 @@
+# src/tuner.py
+"""Tune PacmanAgent scoring parameters with headless games.
+
+Candidates are drawn by random search or CMA-ES (needs the optional ``cma``
+package) and ranked with successive halving: every candidate plays a few
+games, only the best 1/eta play eta times as many, and so on until the full
+budget is reached. Games run in a process pool and every candidate is played
+on the same seeds, so scores are directly comparable.
+
+    python -m src.tuner --method random --candidates 81 --output agent_params.json
+"""
+import argparse
+import json
+import math
+import random
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Tuple
+from .constants import AGENT_PARAMS
+from .headless import play_game
+
+# Parameter name -> (low, high) search bounds
+PARAM_SPACE = {
+    'distance_weight': (0.1, 3.0),
+    'danger_weight': (0.0, 10.0),
+    'near_distance': (1.0, 5.0),
+    'near_danger': (0.0, 5.0),
+    'far_distance': (1.0, 8.0),
+    'far_danger': (0.0, 3.0),
+}
+
+# Every life left at the end is worth this many points when ranking candidates
+LIFE_BONUS = 100
+
+
+def _play(task: Tuple[Dict[str, float], int, int]) -> float:
+    """Play one game in a worker process and return its fitness."""
+    params, seed, max_steps = task
+    result = play_game(params, seed=seed, max_steps=max_steps)
+    return result['score'] + LIFE_BONUS * result['lives']
+
+
+class ParameterTuner:
+    def __init__(self, workers: int = None, min_games: int = 2, max_games: int = 18,
+                 eta: int = 3, max_steps: int = 2000, seed: int = 0):
+        self.workers = workers
+        self.min_games = min_games
+        self.max_games = max_games
+        self.eta = eta
+        self.max_steps = max_steps
+        self.rng = random.Random(seed)
+        self.seeds = [seed * 10000 + i for i in range(max_games)]
+        self.best = None  # (fitness, params) evaluated on all max_games seeds
+
+    def from_unit(self, x: List[float]) -> Dict[str, float]:
+        """Map a point of the unit cube onto PARAM_SPACE."""
+        params = {}
+        for value, (name, (low, high)) in zip(x, PARAM_SPACE.items()):
+            value = min(max(value, 0.0), 1.0)
+            params[name] = low + value * (high - low)
+        return params
+
+    def to_unit(self, params: Dict[str, float]) -> List[float]:
+        """Map parameters onto the unit cube, the inverse of from_unit."""
+        return [(params[name] - low) / (high - low) for name, (low, high) in PARAM_SPACE.items()]
+
+    def sample(self) -> Dict[str, float]:
+        """Draw uniformly random parameters."""
+        return self.from_unit([self.rng.random() for _ in PARAM_SPACE])
+
+    def successive_halving(self, pool, candidates: List[Dict[str, float]]) -> List[float]:
+        """Score candidates, cutting the worst early. Returns one fitness per candidate.
+
+        A candidate's fitness is its mean over the games of the last rung it
+        reached. Candidates that survive every rung are kept in ``self.best``.
+        """
+        results = [[] for _ in candidates]
+        alive = list(range(len(candidates)))
+        games = self.min_games
+
+        while True:
+            games = min(games, self.max_games)
+            tasks = [(candidates[i], seed, self.max_steps)
+                     for i in alive for seed in self.seeds[len(results[i]):games]]
+            fitnesses = iter(pool.map(_play, tasks))
+            for i in alive:
+                results[i].extend(next(fitnesses) for _ in range(games - len(results[i])))
+
+            alive.sort(key=lambda i: sum(results[i]) / len(results[i]), reverse=True)
+            if games >= self.max_games:
+                break
+            alive = alive[:max(1, math.ceil(len(alive) / self.eta))]
+            games *= self.eta
+
+        for i in alive:
+            self._record(sum(results[i]) / len(results[i]), candidates[i])
+        return [sum(r) / len(r) for r in results]
+
+    def _record(self, fitness: float, params: Dict[str, float]):
+        """Keep the best fully evaluated candidate."""
+        if self.best is None or fitness > self.best[0]:
+            self.best = (fitness, params)
+
+    def random_search(self, n_candidates: int) -> Tuple[float, Dict[str, float]]:
+        """Random search; the current defaults always take part as a baseline."""
+        candidates = [dict(AGENT_PARAMS)] + [self.sample() for _ in range(n_candidates - 1)]
+        with ProcessPoolExecutor(self.workers) as pool:
+            self.successive_halving(pool, candidates)
+        return self.best
+
+    def cma_es(self, generations: int, population: int = None) -> Tuple[float, Dict[str, float]]:
+        """CMA-ES over the unit cube, each generation ranked by successive halving."""
+        try:
+            import cma
+        except ImportError as exc:
+            raise ImportError("CMA-ES tuning needs the 'cma' package: pip install cma") from exc
+
+        options = {'bounds': [0, 1], 'seed': self.rng.randrange(1, 2**31), 'verbose': -9}
+        if population:
+            options['popsize'] = population
+        es = cma.CMAEvolutionStrategy(self.to_unit(AGENT_PARAMS), 0.3, options)
+
+        with ProcessPoolExecutor(self.workers) as pool:
+            for _ in range(generations):
+                xs = es.ask()
+                candidates = [self.from_unit(x) for x in xs]
+                fitnesses = self.successive_halving(pool, candidates)
+                # CMA-ES minimises; eliminated candidates keep their early-rung mean
+                es.tell(xs, [-fitness for fitness in fitnesses])
+        return self.best
+
+
+def save_params(path: str, best: Tuple[float, Dict[str, float]], **info):
+    """Write the best parameters in the format PacmanAgent's load_params reads."""
+    fitness, params = best
+    with open(path, 'w') as f:
+        json.dump({'params': params, 'fitness': fitness, **info}, f, indent=2)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Tune PacmanAgent scoring parameters.')
+    parser.add_argument('--method', choices=['random', 'cma'], default='random')
+    parser.add_argument('--candidates', type=int, default=81, help='random search candidates')
+    parser.add_argument('--generations', type=int, default=10, help='CMA-ES generations')
+    parser.add_argument('--population', type=int, default=None, help='CMA-ES population size')
+    parser.add_argument('--min-games', type=int, default=2)
+    parser.add_argument('--max-games', type=int, default=18)
+    parser.add_argument('--eta', type=int, default=3)
+    parser.add_argument('--max-steps', type=int, default=2000)
+    parser.add_argument('--workers', type=int, default=None)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--output', default='agent_params.json')
+    args = parser.parse_args()
+
+    tuner = ParameterTuner(args.workers, args.min_games, args.max_games,
+                           args.eta, args.max_steps, args.seed)
+    if args.method == 'cma':
+        best = tuner.cma_es(args.generations, args.population)
+    else:
+        best = tuner.random_search(args.candidates)
+
+    save_params(args.output, best, method=args.method, games=args.max_games, seed=args.seed)
+    print(f"Best fitness {best[0]:.1f} over {args.max_games} games, written to {args.output}")
+    for name, value in best[1].items():
+        print(f"  {name}: {value:.3f}")
+
+
+if __name__ == '__main__':
+    main()
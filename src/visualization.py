@@ -80,7 +80,9 @@ class GameVisualizer:
         colors = {
             'BFS': (100, 100, 255),  # Light blue for BFS exploration
             'DFS': (255, 100, 100),  # Light red for DFS exploration
-            'A*': (100, 255, 100)    # Light green for A* exploration
+            'A*': (100, 255, 100),   # Light green for A* exploration
+            'Bi-BFS': (255, 180, 80),  # Orange for bidirectional BFS exploration
+            'Bi-A*': (200, 100, 255)   # Purple for bidirectional A* exploration
         }
         
         # Draw all explored nodes with small circles
@@ -0,0 +1,116 @@
+# src/zobrist.py
+import random
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple
+from .constants import *
+
+class ZobristKeys:
+    """Random 64-bit keys for every (piece, cell) pair of a board.
+
+    The hash of a state is the XOR of the keys of Pacman's cell, each ghost's
+    cell and every cell still holding food or a power pellet. Moving a piece
+    or eating a pellet only XORs one or two keys, so the hash can be kept up to
+    date without rehashing the board.
+    """
+
+    def __init__(self, rows: int, cols: int, num_ghosts: int, seed: int = 0):
+        rng = random.Random(seed)
+
+        def table():
+            return [[rng.getrandbits(64) for _ in range(cols)] for _ in range(rows)]
+
+        self.pacman = table()
+        self.ghosts = [table() for _ in range(num_ghosts)]
+        self.pellets = {FOOD: table(), POWER_PELLET: table()}
+
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def for_board(rows: int, cols: int, num_ghosts: int) -> 'ZobristKeys':
+        """Shared keys per board size, so hashes of separate GameStates agree."""
+        return ZobristKeys(rows, cols, num_ghosts)
+
+    def hash_state(self, game_state) -> int:
+        """Hash a state from scratch. Used once at setup and to check the incremental hash."""
+        h = self.pacman[game_state.pacman_pos[0]][game_state.pacman_pos[1]]
+        for keys, ghost in zip(self.ghosts, game_state.ghosts):
+            h ^= keys[ghost.position[0]][ghost.position[1]]
+        maze = game_state.maze
+        for i in range(len(maze)):
+            for j in range(len(maze[0])):
+                cell = maze[i][j]
+                if cell in self.pellets:
+                    h ^= self.pellets[cell][i][j]
+        return h
+
+
+class TranspositionTable:
+    """Fixed-size table of search results keyed by Zobrist hash.
+
+    Each hash maps to one slot (``key % capacity``). When two states compete
+    for a slot the replacement policy decides who stays:
+
+    - 'depth': keep whichever entry was searched deeper (ties go to the new one)
+    - 'always': the new entry always wins
+    """
+
+    POLICIES = ('depth', 'always')
+
+    def __init__(self, capacity: int = 1 << 16, policy: str = 'depth'):
+        if policy not in self.POLICIES:
+            raise ValueError(f"Unknown replacement policy {policy!r}, expected one of {self.POLICIES}")
+        self.capacity = capacity
+        self.policy = policy
+        # Each slot is None or (key, depth, value, best_move)
+        self.slots: List[Optional[Tuple[int, int, float, Optional[Tuple[int, int]]]]] = [None] * capacity
+        self.clear_stats()
+
+    def clear_stats(self):
+        """Reset the hit-rate counters."""
+        self.probes = 0
+        self.hits = 0
+        self.stores = 0
+        self.overwrites = 0  # A different state was evicted
+        self.rejected = 0    # Store refused by the replacement policy
+
+    def probe(self, key: int, depth: int = 0):
+        """Return (value, best_move) stored for ``key`` at ``depth`` or deeper, else None."""
+        self.probes += 1
+        entry = self.slots[key % self.capacity]
+        if entry is not None and entry[0] == key and entry[1] >= depth:
+            self.hits += 1
+            return entry[2], entry[3]
+        return None
+
+    def store(self, key: int, depth: int, value: float, best_move: Tuple[int, int] = None) -> bool:
+        """Store a search result. Returns False if the replacement policy kept the old entry."""
+        index = key % self.capacity
+        entry = self.slots[index]
+        if entry is not None and self.policy == 'depth' and depth < entry[1]:
+            self.rejected += 1
+            return False
+        if entry is not None and entry[0] != key:
+            self.overwrites += 1
+        self.slots[index] = (key, depth, value, best_move)
+        self.stores += 1
+        return True
+
+    def clear(self):
+        """Drop all entries and statistics."""
+        self.slots = [None] * self.capacity
+        self.clear_stats()
+
+    @property
+    def hit_rate(self) -> float:
+        return self.hits / self.probes if self.probes else 0.0
+
+    def stats(self) -> Dict[str, float]:
+        """Counters describing how well the table is working."""
+        return {
+            'probes': self.probes,
+            'hits': self.hits,
+            'hit_rate': self.hit_rate,
+            'stores': self.stores,
+            'overwrites': self.overwrites,
+            'rejected': self.rejected,
+            'filled': sum(entry is not None for entry in self.slots),
+        }